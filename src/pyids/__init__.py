@@ -1,5 +1,7 @@
 from .core import readIDS, toPydantic
 from .models import IdsModel
+from .merge import mergeIDS, specificationHash, facetHash
+from .batch import evaluateBatch
 
-__all__ = ["readIDS", "toPydantic", "IdsModel"]
+__all__ = ["readIDS", "toPydantic", "IdsModel", "mergeIDS", "specificationHash", "facetHash", "evaluateBatch"]
 __version__ = "0.1.0"
@@ -0,0 +1,521 @@
+import importlib
+import math
+import re
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Union
+
+from pydantic import BaseModel
+
+from .merge import facetHash
+from .models import EntityModel, IdsModel, PropertyModel, SpecificationModel
+
+# Column names with a fixed meaning in the element table; everything else is
+# either a property column ("Pset_WallCommon.IsExternal" or a (pset, name)
+# tuple key) or an attribute column keyed by the attribute name ("Name").
+ENTITY_COLUMN = "entity"
+PREDEFINED_TYPE_COLUMN = "predefinedType"
+
+
+def _ensure_numpy():
+    mod = importlib.util.find_spec("numpy")
+    if mod is None:
+        raise ImportError(
+            "numpy is not installed. Install optional extras: `pip install pyids[batch]` "
+            "or install numpy manually."
+        )
+    import numpy as np
+    return np
+
+
+class BatchResult(BaseModel):
+    """
+    Output of evaluateBatch. Matrices are numpy bool arrays of shape
+    (n_specs, n_elements); row i belongs to specifications[i].
+    """
+    specifications: List[SpecificationModel]
+    applicable: Any
+    passed: Any
+    # indices of specs with facets that cannot be checked from columnar data
+    # (partOf, classification, material, or an xs:pattern Python's re rejects);
+    # those facets are left out of `applicable` and `passed`
+    skipped: List[int] = []
+
+    model_config = {"arbitrary_types_allowed": True}
+
+    @property
+    def failed(self):
+        """Elements the spec applies to but whose requirements are not met."""
+        return self.applicable & ~self.passed
+
+
+def _is_missing(v) -> bool:
+    return v is None or (isinstance(v, float) and math.isnan(v))
+
+
+# xs:boolean lexical forms, compared case-insensitively
+_TRUE_FORMS = {"true", "1"}
+_FALSE_FORMS = {"false", "0"}
+
+
+def _as_bool(v) -> Optional[bool]:
+    if isinstance(v, bool):
+        return v
+    text = str(v).strip().lower()
+    if text in _TRUE_FORMS:
+        return True
+    if text in _FALSE_FORMS:
+        return False
+    return None
+
+
+def _is_boolean_type(data_type) -> bool:
+    if isinstance(data_type, list):
+        data_type = data_type[0] if data_type else None
+    return isinstance(data_type, str) and data_type.upper() == "IFCBOOLEAN"
+
+
+def _as_float(v) -> Optional[float]:
+    if isinstance(v, bool):
+        return None
+    try:
+        return float(v)
+    except (TypeError, ValueError):
+        return None
+
+
+def _index_key(v):
+    """
+    Lookup key for a column value. Bools, numbers and text are tagged apart,
+    since True, 1 and 1.0 hash equal; ints and floats share a numeric key.
+    """
+    if hasattr(v, "item") and not isinstance(v, (str, bytes)):
+        v = v.item()  # numpy scalars inside object columns
+    if _is_missing(v):
+        return None
+    if isinstance(v, bool):
+        return ("bool", v)
+    if isinstance(v, (int, float)):
+        return ("num", float(v))
+    return ("str", str(v))
+
+
+def _key_text(key) -> str:
+    """Lexical form of a column value, as xs:pattern sees it."""
+    if key is None:
+        return ""
+    kind, v = key
+    if kind == "bool":
+        return "true" if v else "false"
+    if kind == "num":
+        return str(int(v)) if v.is_integer() else repr(v)
+    return v
+
+
+class _Column:
+    """
+    A column split into integer codes and its distinct values, so facet
+    checks run once per distinct value and are broadcast with numpy.
+    Literal lookups go through a value -> position index and never scan
+    the distinct values; the lexical, numeric and case-folded views used
+    by patterns, bounds and booleans are built lazily, once per column.
+    """
+
+    def __init__(self, np, data):
+        self.np = np
+        arr = np.asarray(data).reshape(-1)
+        self._numbers = None
+        if arr.dtype.kind == "S":
+            arr = arr.astype(str)
+        if arr.dtype.kind == "O" and set(map(type, arr.tolist())) <= {str, type(None)}:
+            # text with gaps (the common object column): factorize the text in numpy
+            missing = np.equal(arr, None)
+            uniques, inverse = np.unique(arr[~missing].astype(str), return_inverse=True)
+            codes = np.full(arr.shape[0], len(uniques), dtype=np.intp)
+            codes[~missing] = inverse.reshape(-1)
+            self.keys = [("str", u) for u in uniques.tolist()] + [None]
+        elif arr.dtype.kind in "Ubiuf":
+            uniques, codes = np.unique(arr, return_inverse=True)
+            values = uniques.tolist()
+            if arr.dtype.kind == "U":
+                self.keys = [("str", v) for v in values]
+            elif arr.dtype.kind == "b":
+                self.keys = [("bool", v) for v in values]
+            else:
+                self.keys = [None if v != v else ("num", float(v)) for v in values]
+                self._numbers = uniques.astype(float)
+        else:
+            # mixed object columns: bools, numbers and text need _index_key
+            index: Dict[Any, int] = {}
+            codes = np.empty(arr.shape[0], dtype=np.intp)
+            for i, v in enumerate(arr.tolist()):
+                codes[i] = index.setdefault(_index_key(v), len(index))
+            self.keys = list(index)
+        self.codes = codes.reshape(-1)
+        self.present = np.array([k is not None for k in self.keys], dtype=bool)
+        self._index = None
+        self._texts = None
+        self._text_array = None
+        self._folded = None
+
+    def spread(self, table):
+        return table[self.codes]
+
+    def index(self) -> Dict[Any, int]:
+        # keys are distinct apart from None (missing), which is never looked up
+        if self._index is None:
+            self._index = {k: i for i, k in enumerate(self.keys)}
+        return self._index
+
+    def texts(self):
+        if self._texts is None:
+            self._texts = [_key_text(k) for k in self.keys]
+        return self._texts
+
+    def text_array(self):
+        if self._text_array is None:
+            self._text_array = self.np.array(self.texts(), dtype=str)
+        return self._text_array
+
+    def fullmatch(self, check: "_ValueCheck"):
+        """Regex hits over the distinct values, narrowed first by the literal prefix."""
+        np = self.np
+        texts = self.texts()
+        if not check.prefix:
+            return np.fromiter(map(bool, map(check.regex.fullmatch, texts)), dtype=bool, count=len(texts))
+        table = np.zeros(len(texts), dtype=bool)
+        candidates = np.flatnonzero(np.char.startswith(self.text_array(), check.prefix))
+        fullmatch = check.regex.fullmatch
+        table[candidates] = [fullmatch(texts[i]) is not None for i in candidates.tolist()]
+        return table
+
+    def numbers(self):
+        if self._numbers is None:
+            np = self.np
+            try:
+                self._numbers = np.array(self.texts(), dtype=object).astype(float)
+            except ValueError:
+                self._numbers = np.array([_as_float(t) if k is not None and k[0] != "bool" else None
+                                          for k, t in zip(self.keys, self.texts())], dtype=float)
+            bools = np.array([k is not None and k[0] == "bool" for k in self.keys], dtype=bool)
+            self._numbers[bools | ~self.present] = np.nan
+        return self._numbers
+
+    def folded(self) -> Dict[str, List[int]]:
+        if self._folded is None:
+            self._folded = {}
+            for i, k in enumerate(self.keys):
+                if k is not None and k[0] == "str":
+                    self._folded.setdefault(k[1].strip().lower(), []).append(i)
+        return self._folded
+
+    def match(self, check: "_ValueCheck"):
+        """Bool table over the distinct values: which ones satisfy `check`."""
+        np = self.np
+        if check.any:
+            return self.present.copy()
+        table = np.zeros(len(self.keys), dtype=bool)
+        if check.keys:
+            index = self.index()
+            table[[index[k] for k in check.keys if k in index]] = True
+        if check.folded:
+            folded = self.folded()
+            for form in check.folded:
+                table[folded.get(form, [])] = True
+        if check.numbers:
+            table |= np.isin(self.numbers(), check.numbers)
+        if check.regex is not None:
+            table |= self.fullmatch(check)
+        for bounds in check.bounds:
+            nums = self.numbers()
+            hit = ~np.isnan(nums)
+            for key, op in (
+                ("min", np.greater_equal),
+                ("minInclusive", np.greater_equal),
+                ("minExclusive", np.greater),
+                ("max", np.less_equal),
+                ("maxInclusive", np.less_equal),
+                ("maxExclusive", np.less),
+            ):
+                bound = _as_float(bounds.get(key))
+                if bound is not None:
+                    hit &= op(nums, bound)
+            table |= hit
+        return table & self.present
+
+
+_IDENTIFIER = re.compile(r"[A-Za-z0-9_]+")
+_REGEX_META = set(".^$*+?{}[]\\|()")
+
+
+def _literal_prefix(pattern: str) -> str:
+    """Leading text every match of `pattern` must start with ("" if none)."""
+    if "|" in pattern:
+        return ""
+    end = 0
+    while end < len(pattern) and pattern[end] not in _REGEX_META:
+        end += 1
+    if end < len(pattern) and pattern[end] in "*?{":
+        end -= 1  # the last literal is quantified and may be absent
+    return pattern[:max(end, 0)]
+
+
+def _flatten(expected) -> List[Any]:
+    if isinstance(expected, list):
+        return [i for e in expected for i in _flatten(e)]
+    return [expected]
+
+
+class _ValueCheck:
+    """
+    A facet value prepared once: index keys for literals and enumerations,
+    numbers for numeric literals, one compiled regex for xs:pattern values
+    (XSD patterns match the whole value) and numeric bounds. Booleans
+    compare by xs:boolean meaning ("true", "TRUE", "1") against bool
+    values, and against text too when `boolean` is set (IFCBOOLEAN facets).
+    Raises re.error for patterns Python's re cannot compile.
+    """
+
+    def __init__(self, expected, boolean: bool = False):
+        self.any = expected is None
+        self.keys = set()
+        self.folded = set()
+        self.numbers = []
+        self.bounds = []
+        patterns = []
+        for e in ([] if self.any else _flatten(expected)):
+            if isinstance(e, dict) and "pattern" in e:
+                patterns.extend(str(p) for p in _flatten(e["pattern"]))
+            elif isinstance(e, dict):
+                self.bounds.append(e)
+            elif e is not None:
+                self._add_literal(e, boolean)
+        self.regex = self._compile(patterns)
+        self.prefix = _literal_prefix(patterns[0]) if len(patterns) == 1 else ""
+
+    @staticmethod
+    def _compile(patterns, flags=0):
+        if not patterns:
+            return None
+        return re.compile("|".join("(?:%s)" % p for p in patterns), flags)
+
+    def _add_literal(self, e, boolean):
+        text = ("true" if e else "false") if isinstance(e, bool) else str(e)
+        self.keys.add(("str", text))
+        number = _as_float(text)
+        if number is not None:
+            self.numbers.append(number)
+        truth = _as_bool(text)
+        if truth is not None:
+            self.keys.add(("bool", truth))
+            if boolean:
+                self.folded |= _TRUE_FORMS if truth else _FALSE_FORMS
+
+    @classmethod
+    def for_names(cls, names: List[str]) -> "_ValueCheck":
+        """
+        Case-insensitive check for entity names / predefined types. These are
+        plain identifiers, so any other entry is an xs:pattern normalization
+        flattened to a string (e.g. "IFCWALL|IFCWALLSTANDARDCASE").
+        """
+        check = cls(None)
+        check.any = False
+        check.folded = {n.lower() for n in names if _IDENTIFIER.fullmatch(n)}
+        check.regex = cls._compile([n for n in names if not _IDENTIFIER.fullmatch(n)], re.IGNORECASE)
+        check.prefix = ""  # a case-insensitive regex has no exact prefix
+        return check
+
+
+class _Evaluator:
+    def __init__(self, np, elements: Mapping[Any, Any]):
+        self.np = np
+        self.elements = elements
+        self.columns: Dict[Any, _Column] = {}
+        self.cache: Dict[str, Any] = {}
+        lengths = {len(v) for v in elements.values()}
+        if len(lengths) > 1:
+            raise ValueError("all element columns must have the same length")
+        self.n = lengths.pop() if lengths else 0
+
+    def column(self, key) -> Optional[_Column]:
+        if key not in self.columns:
+            data = self.elements.get(key)
+            self.columns[key] = _Column(self.np, data) if data is not None else None
+        return self.columns[key]
+
+    def property_keys(self, pset, name) -> List[Any]:
+        """
+        Element columns holding property `name` of `pset`; a missing pset or
+        name matches any, as a facet without one does.
+        """
+        keys = []
+        for key in self.elements:
+            if isinstance(key, tuple) and len(key) == 2:
+                p, n = key
+            elif isinstance(key, str) and "." in key:
+                p, n = key.split(".", 1)
+            else:
+                continue
+            if (pset is None or p == pset) and (name is None or n == name):
+                keys.append(key)
+        return keys
+
+    def _constant(self, value: bool):
+        return self.np.full(self.n, value, dtype=bool)
+
+    def _cached(self, facet, compute, tag=""):
+        # identical facets are common across stakeholder files; check each once
+        key = tag + type(facet).__name__ + ":" + facetHash(facet)
+        if key not in self.cache:
+            self.cache[key] = compute()
+        return self.cache[key]
+
+    def entity(self, facet: EntityModel):
+        def compute():
+            col = self.column(ENTITY_COLUMN)
+            if col is None:
+                raise KeyError("elements need an %r column to evaluate entity facets" % ENTITY_COLUMN)
+            try:
+                names = _ValueCheck.for_names(facet.name)
+                types = _ValueCheck.for_names(facet.predefinedType) if facet.predefinedType else None
+            except re.error:
+                return None
+            mask = col.spread(col.match(names))
+            if types is not None:
+                ptcol = self.column(PREDEFINED_TYPE_COLUMN)
+                if ptcol is None:
+                    return self._constant(False)
+                mask = mask & ptcol.spread(ptcol.match(types))
+            return mask
+        return self._cached(facet, compute)
+
+    def _valued_column(self, key, check: _ValueCheck, cardinality):
+        col = self.column(key)
+        if col is None:
+            return self._constant(cardinality in ("optional", "prohibited"))
+        hit = col.match(check)
+        if cardinality == "prohibited":
+            return col.spread(~hit)
+        if cardinality == "optional":
+            return col.spread(hit | ~col.present)
+        return col.spread(hit)
+
+    def _valued(self, keys, value, cardinality, boolean=False):
+        """
+        Check a value facet over its candidate columns (several when the
+        facet's name is an enumeration or left open): required needs one
+        match, optional and prohibited must hold for every candidate.
+        """
+        try:
+            check = _ValueCheck(value, boolean)
+        except re.error:
+            return None
+        if not keys:
+            return self._constant(cardinality in ("optional", "prohibited"))
+        masks = [self._valued_column(k, check, cardinality) for k in keys]
+        combine = self.np.logical_and if cardinality in ("optional", "prohibited") else self.np.logical_or
+        return combine.reduce(masks)
+
+    @staticmethod
+    def _cardinality(c):
+        if isinstance(c, list):
+            c = c[0] if c else None
+        return c
+
+    # In applicability, a facet selects the elements that have the value, so
+    # cardinality does not apply and the facet is checked as "required".
+
+    def property(self, facet: PropertyModel, applicability: bool = False):
+        cardinality = "required" if applicability else self._cardinality(facet.cardinality)
+        return self._cached(facet, lambda: self._valued(
+            self.property_keys(facet.propertySet, facet.baseName),
+            facet.value,
+            cardinality,
+            _is_boolean_type(facet.dataType),
+        ), tag=str(cardinality))
+
+    def attribute(self, facet: dict, applicability: bool = False):
+        names = facet.get("name")
+        if not isinstance(names, list):
+            names = [names]
+        if applicability:
+            cardinality = "required"
+        else:
+            cardinality = self._cardinality(facet.get("@cardinality") or facet.get("cardinality"))
+        return self._cached(facet, lambda: self._valued(
+            [str(n) for n in names if n is not None],
+            facet.get("value"),
+            cardinality,
+        ), tag=str(cardinality))
+
+
+def _iter_specifications(models) -> List[SpecificationModel]:
+    if isinstance(models, (IdsModel, SpecificationModel)):
+        models = [models]
+    specs = []
+    for m in models:
+        if isinstance(m, SpecificationModel):
+            specs.append(m)
+        elif m.specifications is not None:
+            specs.extend(m.specifications.specification)
+    return specs
+
+
+def evaluateBatch(
+    models: Union[IdsModel, SpecificationModel, Iterable[Union[IdsModel, SpecificationModel]]],
+    elements: Mapping[Any, Any],
+) -> BatchResult:
+    """
+    Evaluate every specification of one or more IdsModels against a columnar
+    table of element records. Requires the optional `numpy` extra.
+
+    `elements` maps column names to equal-length arrays: "entity" (IFC class),
+    optionally "predefinedType", property columns keyed "Pset.Property" or
+    (pset, property), and attribute columns keyed by attribute name. Missing
+    values are None/NaN.
+
+    Each column is factorized once; facets are checked per distinct value and
+    broadcast to all elements, and identical facets across specs are only
+    evaluated once. The result holds (n_specs, n_elements) bool matrices, so
+    for very large runs pass elements in chunks.
+    """
+    np = _ensure_numpy()
+    specs = _iter_specifications(models)
+    ev = _Evaluator(np, elements)
+
+    applicable = np.ones((len(specs), ev.n), dtype=bool)
+    passed = np.ones((len(specs), ev.n), dtype=bool)
+    skipped = []
+
+    for i, spec in enumerate(specs):
+        # None marks a facet that cannot be checked from the columns
+        filters = []
+        app = spec.applicability
+        if app is not None:
+            filters.extend(ev.entity(f) for f in app.entity or [])
+            filters.extend(ev.property(f, applicability=True) for f in app.property or [])
+            filters.extend(ev.attribute(f, applicability=True) for f in app.attribute or [] if isinstance(f, dict))
+            if app.partOf or app.classification or app.material:
+                filters.append(None)
+
+        for mask in filters:
+            if mask is None:
+                if i not in skipped:
+                    skipped.append(i)
+            else:
+                applicable[i] &= mask
+
+        checks = []
+        for req in spec.requirements or []:
+            checks.extend(ev.entity(f) for f in req.entity or [])
+            checks.extend(ev.property(f) for f in req.property or [])
+            checks.extend(ev.attribute(f) for f in req.attribute or [] if isinstance(f, dict))
+            if req.partOf or req.classification or req.material:
+                checks.append(None)
+
+        for mask in checks:
+            if mask is None:
+                if i not in skipped:
+                    skipped.append(i)
+            else:
+                passed[i] &= mask
+
+    return BatchResult(specifications=specs, applicable=applicable, passed=passed, skipped=skipped)
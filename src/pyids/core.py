@@ -73,6 +73,12 @@ def deep_normalize_values(obj):
     if isinstance(obj, dict):
         for k in list(obj.keys()):
             v = obj[k]
+            if k == "value":
+                # keep patterns distinguishable from literal values
+                pattern = v["pattern"] if isinstance(v, dict) and list(v) == ["pattern"] else _pattern_of(v)
+                if pattern is not None:
+                    obj[k] = {"pattern": pattern}
+                    continue
             if k in _NORMALIZE_KEYS:
                 ext = _extract_scalar_from_restriction(v)
                 if ext is not None:
@@ -134,6 +140,36 @@ def _unwrap_value(maybe):
 
     return maybe
 
+def _pattern_of(maybe):
+    """
+    Return the xs:pattern value of an xs:restriction wrapper (a list if it
+    holds several patterns), or None when it is not a pattern restriction.
+    """
+    if not isinstance(maybe, dict):
+        return None
+    restrictions = _ensure_list(maybe.get("xs:restriction") or maybe.get("restriction")) or []
+    patterns = []
+    for r in restrictions:
+        if not isinstance(r, dict):
+            continue
+        for p in _ensure_list(r.get("xs:pattern") or r.get("pattern")) or []:
+            if isinstance(p, dict) and "@value" in p:
+                patterns.append(str(p["@value"]))
+    if not patterns:
+        return None
+    return patterns[0] if len(patterns) == 1 else patterns
+
+def _unwrap_facet_value(maybe):
+    """
+    Like _unwrap_value, but keeps the restriction kind for patterns:
+    {"pattern": "..."} instead of the bare regex, so it is not mistaken
+    for a literal value.
+    """
+    pattern = _pattern_of(maybe)
+    if pattern is not None:
+        return {"pattern": pattern}
+    return _unwrap_value(maybe)
+
 def _normalize_requirements_block(req: dict) -> dict:
     """
     Normalize a single requirements dict so nested children are lists
@@ -161,7 +197,7 @@ def _normalize_requirements_block(req: dict) -> dict:
                 p["baseName"] = _unwrap_value(p["baseName"]) #_unwrap_simplevalue(p["baseName"])
             # value could be nested restriction or simpleValue; unwrap simpleValue if present
             if "value" in p:
-                p["value"] = _unwrap_value(p["value"]) #_unwrap_simplevalue(p["value"])
+                p["value"] = _unwrap_facet_value(p["value"]) #_unwrap_simplevalue(p["value"])
             # sometimes name is used instead of baseName - unwrap if present
             if "name" in p:
                 # name might be {"name": {"simpleValue": "..."}}
@@ -176,7 +212,7 @@ def _normalize_requirements_block(req: dict) -> dict:
                 # name may be {"simpleValue": "..."} or {"name": {"simpleValue": "..."}}
                 a["name"] = _unwrap_value(a["name"]) #_unwrap_simplevalue(a["name"])
             if "value" in a:
-                a["value"] = _unwrap_value(a["value"]) #_unwrap_simplevalue(a["value"])
+                a["value"] = _unwrap_facet_value(a["value"]) #_unwrap_simplevalue(a["value"])
 
     # Handle entities (unwrap entity.name.simpleValue -> string)
     if "entity" in req and isinstance(req["entity"], list):
@@ -224,6 +260,10 @@ def _normalize_ids_dict(d: Mapping) -> dict:
             if attr in spec and isinstance(spec[attr], dict):
                 spec[attr] = _unwrap_simplevalue(spec[attr])
 
+        # applicability holds the same facet kinds as a requirements block
+        if isinstance(spec.get("applicability"), dict):
+            spec["applicability"] = _normalize_requirements_block(copy.deepcopy(spec["applicability"]))
+
         raw_reqs = spec.get("requirements")
         if raw_reqs is None:
             continue
@@ -0,0 +1,213 @@
+import hashlib
+import json
+import re
+from typing import Any, Dict, Iterable, Optional
+
+from pydantic import BaseModel
+
+from .models import (
+    EntityModel,
+    IdsModel,
+    InfoModel,
+    ProvenanceModel,
+    SpecificationModel,
+    SpecificationsContainer,
+)
+
+# Free-text keys that document a facet but do not change what it checks.
+# Leaving them out lets two stakeholders' specs match when only the wording differs.
+_IGNORED_KEYS = {"description", "@description", "instructions", "@instructions", "provenance"}
+
+# "required" is the IDS default cardinality, so spelling it out must not change the hash
+_CARDINALITY_KEYS = {"cardinality", "@cardinality"}
+
+# IFC entity names and predefined types are case-insensitive identifiers;
+# anything else in those fields is a flattened xs:pattern and keeps its case
+_IDENTIFIER = re.compile(r"[A-Za-z0-9_]+")
+
+# xs:boolean lexical forms, for values of IFCBOOLEAN facets
+_BOOLEAN_FORMS = {"true": "true", "1": "true", "false": "false", "0": "false"}
+
+# Facet kinds inside an applicability or requirements block, in the order
+# RequirementModel declares them
+_BLOCK_FACETS = ("entity", "partOf", "classification", "attribute", "property", "material", "raw")
+
+
+def _upper_names(v):
+    if isinstance(v, list):
+        return [_upper_names(i) for i in v]
+    if isinstance(v, str) and _IDENTIFIER.fullmatch(v):
+        return v.upper()
+    return v
+
+
+def _boolean_value(v):
+    if isinstance(v, list):
+        return [_boolean_value(i) for i in v]
+    if isinstance(v, bool):
+        return "true" if v else "false"
+    if isinstance(v, str):
+        return _BOOLEAN_FORMS.get(v.strip().lower(), v)
+    return v
+
+
+def _canonical(obj, entity: bool = False):
+    """
+    Reduce a facet (model, dict, list or scalar) to a JSON-able form that is
+    independent of key order, list order and scalar type (0 vs "0"), of the
+    case of entity names ("IfcWall" vs "IFCWALL") and of the spelling of
+    IFCBOOLEAN values ("true" vs "TRUE").
+    """
+    if isinstance(obj, BaseModel):
+        entity = entity or isinstance(obj, EntityModel)
+        obj = obj.model_dump(by_alias=True, exclude_none=True)
+    if isinstance(obj, dict):
+        data_type = obj.get("@dataType") or obj.get("dataType")
+        boolean = isinstance(data_type, str) and data_type.upper() == "IFCBOOLEAN"
+        out = {}
+        for k, v in obj.items():
+            if k in _IGNORED_KEYS:
+                continue
+            if k in _CARDINALITY_KEYS and v == "required":
+                continue
+            if entity and k in ("name", "predefinedType"):
+                v = _upper_names(v)
+            elif boolean and k == "value":
+                v = _boolean_value(v)
+            elif k in ("@dataType", "dataType") and isinstance(v, str):
+                v = v.upper()
+            # nested entity facets, e.g. partOf/entity
+            cv = _canonical(v, entity=(k == "entity"))
+            if cv is None or cv == [] or cv == {} or cv == "":
+                continue
+            out[str(k)] = cv
+        return out
+    if isinstance(obj, (list, tuple)):
+        # IDS facets and enumerations are unordered; sort on the serialized form
+        items = [_canonical(i, entity) for i in obj]
+        items = [i for i in items if i is not None]
+        return sorted(items, key=_dumps)
+    if obj is None:
+        return None
+    return str(obj)
+
+
+def _dumps(obj) -> str:
+    return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+def _digest(*parts: str) -> str:
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(part.encode("utf-8"))
+        h.update(b"\x00")
+    return h.hexdigest()
+
+
+def facetHash(facet: Any) -> str:
+    """
+    Return a canonical structural hash for a single facet
+    (EntityModel, PropertyModel, or a raw attribute/classification dict).
+    """
+    return _digest(_dumps(_canonical(facet)))
+
+
+def _block_hash(block: Any) -> str:
+    if isinstance(block, BaseModel):
+        fields = {k: getattr(block, k, None) for k in _BLOCK_FACETS}
+    elif isinstance(block, dict):
+        fields = {k: block.get(k) for k in _BLOCK_FACETS}
+    else:
+        return facetHash(block)
+
+    parts = []
+    for kind in _BLOCK_FACETS:
+        facets = fields.get(kind)
+        if not facets:
+            continue
+        if not isinstance(facets, list):
+            facets = [facets]
+        parts.append(kind + ":" + ",".join(sorted(facetHash(f) for f in facets)))
+    return _digest(*parts)
+
+
+def specificationHash(spec: SpecificationModel) -> str:
+    """
+    Return a structural hash of what a specification checks: its applicability
+    (all filter facets and occurrence bounds) and its requirements. The name,
+    ifcVersion and free-text descriptions are not part of the hash, so specs
+    that only differ in those are treated as duplicates.
+    """
+    parts = []
+    app = spec.applicability
+    if app is not None:
+        parts.append("applicability:" + _block_hash(app))
+        parts.append("occurs:%s:%s" % (app.minOccurs, app.maxOccurs))
+    reqs = sorted(_block_hash(r) for r in (spec.requirements or []))
+    parts.append("requirements:" + ",".join(reqs))
+    return _digest(*parts)
+
+
+def mergeIDS(
+    models: Iterable[IdsModel],
+    sources: Optional[Iterable[str]] = None,
+    info: Optional[InfoModel] = None,
+) -> IdsModel:
+    """
+    Merge several IdsModel instances into one, folding structurally identical
+    specifications (see specificationHash) into a single entry.
+
+    Runs in one pass over all specifications. The first occurrence of each
+    spec is kept; ifcVersion lists of later duplicates are unioned into it,
+    and every input spec is recorded in the merged spec's `provenance`.
+
+    `sources` labels each input model (e.g. the file name); defaults to the
+    model's info.title, or its position. `info` defaults to the first model's.
+    """
+    models = list(models)
+    labels = list(sources) if sources is not None else []
+    if labels and len(labels) != len(models):
+        raise ValueError("sources must have the same length as models")
+
+    merged: Dict[str, SpecificationModel] = {}
+    first: Optional[IdsModel] = None
+
+    for pos, model in enumerate(models):
+        if first is None:
+            first = model
+        if labels:
+            label = labels[pos]
+        elif model.info is not None and model.info.title:
+            label = model.info.title
+        else:
+            label = str(pos)
+
+        specs = model.specifications.specification if model.specifications else []
+        for idx, spec in enumerate(specs):
+            key = specificationHash(spec)
+            entries = spec.provenance or [ProvenanceModel(source=label, name=spec.name, index=idx)]
+
+            target = merged.get(key)
+            if target is None:
+                target = spec.model_copy(deep=True)
+                target.provenance = list(entries)
+                merged[key] = target
+                continue
+
+            target.provenance.extend(entries)
+            if spec.ifcVersion:
+                versions = list(target.ifcVersion or [])
+                for v in spec.ifcVersion:
+                    if v not in versions:
+                        versions.append(v)
+                target.ifcVersion = versions
+
+    out: Dict[str, Any] = {}
+    if first is not None:
+        out = first.model_dump(by_alias=True, exclude={"info", "specifications"})
+    if info is None and first is not None and first.info is not None:
+        info = first.info.model_copy()
+    result = IdsModel.model_validate(out)
+    result.info = info
+    result.specifications = SpecificationsContainer(specification=list(merged.values()))
+    return result
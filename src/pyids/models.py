@@ -56,6 +56,8 @@ def _ensure_list_of_str(x) -> List[str]:
 class EntityModel(BaseModel):
     # canonical: always a list of allowed names
     name: List[str]
+    # optional list of allowed predefined types (USERDEFINED, NOTDEFINED, ...)
+    predefinedType: Optional[List[str]] = None
 
     @model_validator(mode="before")
     def normalize_name(cls, v):
@@ -71,7 +73,10 @@ class EntityModel(BaseModel):
         if isinstance(v, dict):
             if "name" in v:
                 names = _ensure_list_of_str(v["name"])
-                return {"name": names}
+                out = {"name": names}
+                if v.get("predefinedType") is not None:
+                    out["predefinedType"] = _ensure_list_of_str(v["predefinedType"])
+                return out
             # maybe already normalized with string/list directly under v
             # try to coerce if top-level dict contains single str/list
             if len(v) == 1:
@@ -94,10 +99,13 @@ class PropertyModel(BaseModel):
     value: Optional[Union[str, List[str], dict]] = None
 
     # keep these flexible, but validators could coerce them too if you want
-    dataType: Optional[Union[str, List[str]]] = None
-    cardinality: Optional[Union[str, List[str]]] = None
-    instructions: Optional[Union[str, List[str]]] = None
-    uri: Optional[Union[str, List[str]]] = None
+    # (ifctester emits them as XML attributes, hence the '@' aliases)
+    dataType: Optional[Union[str, List[str]]] = Field(None, alias='@dataType')
+    cardinality: Optional[Union[str, List[str]]] = Field(None, alias='@cardinality')
+    instructions: Optional[Union[str, List[str]]] = Field(None, alias='@instructions')
+    uri: Optional[Union[str, List[str]]] = Field(None, alias='@uri')
+
+    model_config = {"populate_by_name": True}
 
     @model_validator(mode="before")
     def normalize_property(cls, v):
@@ -191,6 +199,12 @@ class PropertyModel(BaseModel):
 
 class ApplicabilityModel(BaseModel):
     entity: List[EntityModel]
+    # further filters narrowing which entities the spec applies to
+    partOf: Optional[List[Any]] = None
+    classification: Optional[List[Any]] = None
+    attribute: Optional[List[Any]] = None
+    property: Optional[List[PropertyModel]] = None
+    material: Optional[List[Any]] = None
     # these are stored as attributes in the dict; we provide aliases
     minOccurs: Optional[int] = Field(None, alias='@minOccurs')
     maxOccurs: Optional[str] = Field(None, alias='@maxOccurs')
@@ -232,12 +246,20 @@ class RequirementModel(BaseModel):
             return cls(**value)
         return super().model_validate(value)
 
+class ProvenanceModel(BaseModel):
+    # where a merged specification came from: source label, original name, position
+    source: str
+    name: str
+    index: int
+
 class SpecificationModel(BaseModel):
     name: str = Field(..., alias='@name')
     ifcVersion: Optional[List[str]] = Field(None, alias='@ifcVersion')
     applicability: Optional[ApplicabilityModel] = None
     #requirements: Optional[Any] = None  # refine later to List[RequirementModel]
     requirements: Optional[List[RequirementModel]] = None
+    # filled in by merge.mergeIDS; one entry per input spec folded into this one
+    provenance: Optional[List[ProvenanceModel]] = None
 
     @model_validator(mode="before")
     def ensure_requirements_list(cls, values):
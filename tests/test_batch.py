@@ -0,0 +1,245 @@
+import copy
+import json
+from pathlib import Path
+
+import pytest
+
+from pyids import readIDS, toPydantic, evaluateBatch
+
+np = pytest.importorskip("numpy")
+
+DUMP = json.loads((Path(__file__).parent.parent / "ids_dump.json").read_text(encoding="utf-8"))
+
+
+def test_evaluate_batch_masks():
+    model = toPydantic(copy.deepcopy(DUMP))
+    elements = {
+        "entity": np.array(["IFCPROJECT", "IfcWallType", "IFCWALLTYPE", "IFCWALL"]),
+        "Name": np.array(["TEST", None, None, None], dtype=object),
+        "Pset_WallCommon.IsExternal": np.array([None, True, False, True], dtype=object),
+    }
+    res = evaluateBatch(model, elements)
+
+    # spec 0: project naming, spec 1: wall type fire rating
+    assert res.applicable.tolist() == [
+        [True, False, False, False],
+        [False, True, True, False],
+    ]
+    assert res.passed[0, 0] and res.passed[1, 1] and not res.passed[1, 2]
+    assert res.failed.tolist()[1] == [False, False, True, False]
+    assert res.skipped == []
+
+
+def test_evaluate_batch_predefined_type_and_bounds():
+    spec = {
+        "@name": "Thick slabs",
+        "applicability": {"entity": [{"name": "IFCSLAB", "predefinedType": "FLOOR"}]},
+        "requirements": {"property": [{
+            "propertySet": "Pset_SlabCommon", "baseName": "Thickness",
+            "value": {"xs:restriction": [{"xs:minInclusive": [{"@value": "0.2"}]}]},
+        }]},
+    }
+    model = toPydantic({"specifications": {"specification": [spec]}})
+    elements = {
+        "entity": np.array(["IFCSLAB", "IFCSLAB", "IFCSLAB"]),
+        "predefinedType": np.array(["FLOOR", "FLOOR", "ROOF"]),
+        ("Pset_SlabCommon", "Thickness"): np.array([0.25, np.nan, 0.3]),
+    }
+    res = evaluateBatch(model, elements)
+    assert res.applicable.tolist() == [[True, True, False]]
+    assert res.failed.tolist() == [[False, True, False]]
+
+
+def _fire_rating_model(*cardinalities):
+    specs = []
+    for c in cardinalities:
+        specs.append({
+            "@name": c,
+            "applicability": {"entity": [{"name": "IFCWALL"}]},
+            "requirements": {"property": [{
+                "propertySet": "Pset_WallCommon", "baseName": "FireRating",
+                "value": "EI60", "@cardinality": c,
+            }]},
+        })
+    return toPydantic({"specifications": {"specification": specs}})
+
+
+def test_evaluate_batch_cardinality():
+    model = _fire_rating_model("required", "optional", "prohibited")
+    elements = {
+        "entity": np.array(["IFCWALL"] * 3),
+        "Pset_WallCommon.FireRating": np.array([None, "EI60", "EI30"], dtype=object),
+    }
+    res = evaluateBatch(model, elements)
+    assert res.passed.tolist() == [
+        [False, True, False],  # required: must be present and match
+        [True, True, False],   # optional: missing is fine, present must match
+        [True, False, True],   # prohibited: must not be present with that value
+    ]
+
+
+def test_evaluate_batch_cardinality_without_column():
+    model = _fire_rating_model("required", "optional", "prohibited")
+    res = evaluateBatch(model, {"entity": np.array(["IFCWALL"])})
+    assert res.passed.tolist() == [[False], [True], [True]]
+
+
+def _name_model(value):
+    spec = {
+        "@name": "named",
+        "applicability": {"entity": [{"name": "IFCSPACE"}]},
+        "requirements": {"attribute": [{"name": {"simpleValue": "Name"}, "value": value}]},
+    }
+    return toPydantic({"specifications": {"specification": [spec]}})
+
+
+def test_evaluate_batch_pattern_values():
+    pattern = {"xs:restriction": [{"@base": "xs:string", "xs:pattern": [{"@value": "[A-Z]{2}[0-9]+"}]}]}
+    model = _name_model(pattern)
+    assert model.specifications.specification[0].requirements[0].attribute[0]["value"] == {"pattern": "[A-Z]{2}[0-9]+"}
+
+    elements = {
+        "entity": np.array(["IFCSPACE"] * 4),
+        "Name": np.array(["AB12", "AB12x", "[A-Z]{2}[0-9]+", None], dtype=object),
+    }
+    res = evaluateBatch(model, elements)
+    assert res.passed.tolist() == [[True, False, False, False]]
+    assert res.skipped == []
+
+
+def test_evaluate_batch_invalid_pattern_is_skipped():
+    pattern = {"xs:restriction": [{"xs:pattern": [{"@value": "[A-Z"}]}]}
+    res = evaluateBatch(_name_model(pattern), {"entity": np.array(["IFCSPACE"]), "Name": np.array(["AB"])})
+    assert res.skipped == [0]
+    assert res.passed.tolist() == [[True]]
+
+
+def test_evaluate_batch_enumerated_attribute_names():
+    names = {"xs:restriction": [{"xs:enumeration": [{"@value": "Name"}, {"@value": "Description"}]}]}
+    spec = {
+        "@name": "labelled",
+        "applicability": {"entity": [{"name": "IFCSPACE"}]},
+        "requirements": {"attribute": [{"name": names}]},
+    }
+    model = toPydantic({"specifications": {"specification": [spec]}})
+    assert model.specifications.specification[0].requirements[0].attribute[0]["name"] == ["Name", "Description"]
+
+    elements = {
+        "entity": np.array(["IFCSPACE"] * 3),
+        "Name": np.array(["A", None, None], dtype=object),
+        "Description": np.array([None, "B", None], dtype=object),
+    }
+    res = evaluateBatch(model, elements)
+    assert res.passed.tolist() == [[True, True, False]]
+
+
+def test_evaluate_batch_property_without_base_name():
+    spec = {
+        "@name": "any common wall property",
+        "applicability": {"entity": [{"name": "IFCWALL"}]},
+        "requirements": {"property": [{"propertySet": "Pset_WallCommon", "value": "TRUE"}]},
+    }
+    model = toPydantic({"specifications": {"specification": [spec]}})
+    elements = {
+        "entity": np.array(["IFCWALL"] * 3),
+        "Pset_WallCommon.IsExternal": np.array([True, False, None], dtype=object),
+        ("Pset_WallCommon", "LoadBearing"): np.array([False, True, None], dtype=object),
+        "Pset_Other.IsExternal": np.array([False, False, True], dtype=object),
+    }
+    res = evaluateBatch(model, elements)
+    assert res.passed.tolist() == [[True, True, False]]
+
+
+def test_evaluate_batch_applicability_filters():
+    external = {
+        "@name": "external walls",
+        "applicability": {
+            "entity": [{"name": "IFCWALL"}],
+            "property": [{"propertySet": "Pset_WallCommon", "baseName": "IsExternal", "value": "TRUE"}],
+        },
+        "requirements": {"attribute": [{"name": "Name"}]},
+    }
+    steel = {
+        "@name": "steel members",
+        "applicability": {"entity": [{"name": "IFCBEAM"}], "material": [{"value": "Steel"}]},
+    }
+    model = toPydantic({"specifications": {"specification": [external, steel]}})
+    elements = {
+        "entity": np.array(["IFCWALL", "IFCWALL", "IFCWALL", "IFCBEAM"]),
+        "Pset_WallCommon.IsExternal": np.array([True, False, None, None], dtype=object),
+        "Name": np.array([None, None, None, "B1"], dtype=object),
+    }
+    res = evaluateBatch(model, elements)
+    assert res.applicable.tolist()[0] == [True, False, False, False]
+    assert res.failed.tolist()[0] == [True, False, False, False]
+    # material filters cannot be checked from columns: reported, not guessed
+    assert res.skipped == [1]
+
+
+def test_evaluate_batch_boolean_lexical_forms():
+    pytest.importorskip("ifctester")
+    ids_path = Path(__file__).parent.parent / "ids_files" / "IDS_SimpleBIM_examples.ids"
+    model = toPydantic(readIDS(str(ids_path)))
+    spec = next(s for s in model.specifications.specification if s.name == "External wall requirement")
+    assert spec.applicability.property[0].value == "true"
+
+    elements = {
+        "entity": np.array(["IFCWALL"] * 4),
+        "Pset_WallCommon.IsExternal": np.array([True, False, "TRUE", "0"], dtype=object),
+    }
+    res = evaluateBatch(spec, elements)
+    assert res.applicable.tolist() == [[True, False, True, False]]
+
+
+def test_evaluate_batch_boolean_column_without_data_type():
+    spec = {
+        "@name": "external",
+        "applicability": {"entity": [{"name": "IFCWALL"}]},
+        "requirements": {"property": [{"propertySet": "Pset_WallCommon", "baseName": "IsExternal", "value": "true"}]},
+    }
+    model = toPydantic({"specifications": {"specification": [spec]}})
+    elements = {
+        "entity": np.array(["IFCWALL"] * 3),
+        "Pset_WallCommon.IsExternal": np.array([True, False, True]),
+    }
+    res = evaluateBatch(model, elements)
+    assert res.passed.tolist() == [[True, False, True]]
+
+
+def test_evaluate_batch_object_column_keeps_bools_apart_from_numbers():
+    def flag_model(value):
+        spec = {
+            "@name": "flag",
+            "applicability": {"entity": [{"name": "IFCWALL"}]},
+            "requirements": {"property": [{"propertySet": "P", "baseName": "Flag", "value": value}]},
+        }
+        return toPydantic({"specifications": {"specification": [spec]}})
+
+    elements = {
+        "entity": np.array(["IFCWALL"] * 4),
+        "P.Flag": np.array([1, True, 0.0, False], dtype=object),
+    }
+    assert evaluateBatch(flag_model("TRUE"), elements).passed.tolist() == [[False, True, False, False]]
+    # xs:boolean also spells true as "1", and the number 1 matches numerically
+    assert evaluateBatch(flag_model("1"), elements).passed.tolist() == [[True, True, False, False]]
+
+
+def test_evaluate_batch_value_lookup_numbers_and_pattern_prefix():
+    def model(value):
+        spec = {
+            "@name": "v",
+            "applicability": {"entity": [{"name": "IFCWALL"}]},
+            "requirements": {"attribute": [{"name": "Tag", "value": value}]},
+        }
+        return toPydantic({"specifications": {"specification": [spec]}})
+
+    entity = np.array(["IFCWALL"] * 5)
+    text = {"entity": entity, "Tag": np.array(["AC", "ABC", "ABBC", "XAC", None], dtype=object)}
+    ab_c = {"xs:restriction": [{"xs:pattern": [{"@value": "AB?C"}]}]}
+    assert evaluateBatch(model(ab_c), text).passed.tolist() == [[True, True, False, False, False]]
+
+    # numeric literals and bounds also match numbers written as text
+    mixed = {"entity": entity, "Tag": np.array(["2.0", "2", 2, "x", 3.5], dtype=object)}
+    assert evaluateBatch(model("2"), mixed).passed.tolist() == [[True, True, True, False, False]]
+    bounds = {"xs:restriction": [{"xs:minExclusive": [{"@value": "2"}]}]}
+    assert evaluateBatch(model(bounds), mixed).passed.tolist() == [[False, False, False, False, True]]
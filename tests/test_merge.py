@@ -0,0 +1,106 @@
+import copy
+import json
+from pathlib import Path
+
+from pyids import toPydantic, mergeIDS, specificationHash
+
+DUMP = json.loads((Path(__file__).parent.parent / "ids_dump.json").read_text(encoding="utf-8"))
+
+
+def test_merge_folds_duplicates_and_keeps_provenance():
+    a = toPydantic(copy.deepcopy(DUMP))
+    other = copy.deepcopy(DUMP)
+    # same checks, different name and ifcVersion -> still a duplicate
+    other["specifications"]["specification"][0]["@name"] = "Project naming (copy)"
+    other["specifications"]["specification"][0]["@ifcVersion"] = ["IFC2X3"]
+    b = toPydantic(other)
+
+    merged = mergeIDS([a, b], sources=["a.ids", "b.ids"])
+    specs = merged.specifications.specification
+    assert len(specs) == len(a.specifications.specification)
+    assert specs[0].ifcVersion == ["IFC4", "IFC2X3"]
+    assert [(p.source, p.name) for p in specs[0].provenance] == [
+        ("a.ids", "Project naming"),
+        ("b.ids", "Project naming (copy)"),
+    ]
+    assert merged.info.title == a.info.title
+
+
+def test_specification_hash_ignores_order_and_sees_changes():
+    d = copy.deepcopy(DUMP)
+    spec = d["specifications"]["specification"][1]
+    base = toPydantic(copy.deepcopy(d)).specifications.specification[1]
+
+    spec["applicability"]["entity"].append({"name": {"simpleValue": "IFCSLABTYPE"}})
+    one = toPydantic(copy.deepcopy(d)).specifications.specification[1]
+    spec["applicability"]["entity"].reverse()
+    two = toPydantic(copy.deepcopy(d)).specifications.specification[1]
+
+    assert specificationHash(one) == specificationHash(two)
+    assert specificationHash(one) != specificationHash(base)
+
+
+def test_predefined_type_is_part_of_the_hash():
+    def slab(ptype):
+        return {"@name": ptype, "applicability": {"entity": [{"name": "IFCSLAB", "predefinedType": ptype}]}}
+
+    model = toPydantic({"specifications": {"specification": [slab("FLOOR"), slab("ROOF"), slab("FLOOR")]}})
+    merged = mergeIDS([model])
+    assert [s.name for s in merged.specifications.specification] == ["FLOOR", "ROOF"]
+
+
+def test_cardinality_is_part_of_the_hash():
+    def fire_rating(cardinality):
+        prop = {"propertySet": "Pset_WallCommon", "baseName": "FireRating"}
+        if cardinality:
+            prop["@cardinality"] = cardinality
+        return {
+            "@name": cardinality or "default",
+            "applicability": {"entity": [{"name": "IFCWALL"}]},
+            "requirements": {"property": [prop]},
+        }
+
+    specs = [fire_rating(c) for c in ("required", "prohibited", "optional", None)]
+    model = toPydantic({"specifications": {"specification": specs}})
+    assert model.specifications.specification[1].requirements[0].property[0].cardinality == "prohibited"
+
+    merged = mergeIDS([model])
+    # explicit "required" and the default fold together; the others stay apart
+    assert [s.name for s in merged.specifications.specification] == ["required", "prohibited", "optional"]
+    assert [p.name for p in merged.specifications.specification[0].provenance] == ["required", "default"]
+
+
+def test_applicability_filters_are_part_of_the_hash():
+    all_walls = {"@name": "all walls", "applicability": {"entity": [{"name": "IFCWALL"}]}}
+    external = copy.deepcopy(all_walls)
+    external["@name"] = "external walls"
+    external["applicability"]["property"] = {
+        "propertySet": {"simpleValue": "Pset_WallCommon"},
+        "baseName": {"simpleValue": "IsExternal"},
+        "value": {"simpleValue": "TRUE"},
+    }
+    model = toPydantic({"specifications": {"specification": [all_walls, external]}})
+    assert model.specifications.specification[1].applicability.property[0].baseName == "IsExternal"
+
+    merged = mergeIDS([model])
+    assert [s.name for s in merged.specifications.specification] == ["all walls", "external walls"]
+
+
+def test_entity_case_and_boolean_spelling_do_not_split_duplicates():
+    def wall(entity, external, data_type="IFCBOOLEAN"):
+        prop = {"propertySet": "Pset_WallCommon", "baseName": "IsExternal", "value": external}
+        if data_type:
+            prop["@dataType"] = data_type
+        return {
+            "@name": "%s/%s" % (entity, external),
+            "applicability": {"entity": [{"name": entity}], "property": [prop]},
+        }
+
+    specs = [wall("IFCWALL", "TRUE"), wall("IfcWall", "true"), wall("IFCWALL", "1"), wall("IFCWALL", "false")]
+    merged = mergeIDS([toPydantic({"specifications": {"specification": specs}})])
+    assert [s.name for s in merged.specifications.specification] == ["IFCWALL/TRUE", "IFCWALL/false"]
+
+    # without an IFCBOOLEAN dataType the value is plain text and stays case-sensitive
+    specs = [wall("IFCWALL", "TRUE", None), wall("IFCWALL", "true", None)]
+    merged = mergeIDS([toPydantic({"specifications": {"specification": specs}})])
+    assert len(merged.specifications.specification) == 2